@@ -7,12 +7,12 @@ What this tool does:
 1) Find .dng files recursively under a dataset directory.
 2) Group those .dng files by their parent directory.
    Each parent directory is treated as a "sequence" (common with CinemaDNG).
-3) Export every DNG to a JPEG using darktable-cli.
+3) Export every DNG to a JPEG using darktable-cli (one run per sequence folder).
 4) Write a job bundle folder containing:
    - images/ (JPEG exports)
    - manifest.txt (list of exported outputs)
    - job.json (metadata about the run)
-5) Optionally zip the job folder to make transport easy (for Drive sync or other handoff).
+5) Optionally zip or tar the job folder to make transport easy (for Drive sync or other handoff).
 
 This script is intentionally "glue code":
 - darktable does the image processing
@@ -25,15 +25,31 @@ Design goals:
 """
 
 import argparse
+import asyncio
+import collections
+import functools
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tarfile
+import tempfile
 import time
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Set, Tuple, Union
+
+# Optional speedup: orjson serializes large job.json payloads several times faster.
+# Install with: pip install "splatpack[fast]"
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # -----------------------------
@@ -43,17 +59,74 @@ from typing import Optional, List, Tuple
 # We only look for .dng files right now. CinemaDNG is typically a folder full of .dng frames.
 DNG_EXTS = {".dng"}
 
+# The spellings cameras actually write, for a single C-level endswith() in the discovery loop.
+# Mixed case (".Dng") is rare and handled by a slower fallback in _is_dng_name().
+_DNG_SUFFIXES = tuple(DNG_EXTS) + tuple(ext.upper() for ext in DNG_EXTS)
+
+# Non-DNG files that may sit in a take folder without darktable importing them
+# (sidecars, audio, camera metadata). Anything else next to the DNGs might be an image
+# darktable would also export, so such folders are exported frame by frame instead.
+BATCH_SAFE_EXTS = {".xmp", ".wav", ".txt", ".json", ".xml", ".md5", ".log"}
+
+# How many folder listings discovery keeps in flight at once.
+# Mostly matters on network filesystems, where each listing waits on a round trip.
+SCAN_WORKERS = 16
+
 # Output folder created inside the dataset folder.
 DEFAULT_OUT_DIRNAME = "_splatpack"
 
+# Folders splatpack refuses to run in, see is_dangerous_directory().
+# Common "do not do this" roots, plus the home directory root itself.
+# You can still run on a subfolder inside home, which is the normal use case.
+DANGEROUS_DIRECTORIES = frozenset(
+    os.path.realpath(p)
+    for p in ("/", "/System", "/Library", "/Applications", "/Users", os.path.expanduser("~"))
+)
+
 # Subfolder inside the job bundle where exported images are placed.
 DEFAULT_IMAGES_DIRNAME = "images"
 
+# How much of a darktable process's stderr we keep for error messages.
+# A batch run over hundreds of frames can log a lot; only the tail explains a failure.
+STDERR_TAIL_BYTES = 64 * 1024
+
+# On POSIX, command arguments reach execve() as bytes. The fixed parts of the darktable-cli
+# command are encoded once up front (see _cmd_arg()) instead of on every run.
+# Windows builds a command line string instead, so arguments stay str there.
+ENCODE_CMD_ARGS = os.name != "nt"
+
+# zip_job() reads files on ZIP_READERS threads, up to ZIP_READ_AHEAD files ahead of the writer.
+# Exports are a few MB per JPEG, so the window stays well under a hundred MB.
+ZIP_READERS = 4
+ZIP_READ_AHEAD = 16
+
+# While a sequence exports, a progress line is printed every PROGRESS_EVERY frames.
+# A batch run is one opaque darktable process, so its progress is read off the staging
+# folder every PROGRESS_POLL_SECONDS.
+PROGRESS_EVERY = 50
+PROGRESS_POLL_SECONDS = 2.0
+
+# Write buffer for manifest.txt and job.json. Large enough that a big manifest
+# goes out in a handful of write() calls.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Inside a darktable config dir: data.db holds styles, darktablerc holds preferences.
+DARKTABLE_STYLE_DB = "data.db"
+DARKTABLE_RC = "darktablerc"
+
+# Characters safe_name() replaces: anything that is not alphanumeric, underscore, dot, or space.
+# \w is Unicode aware, so it matches exactly what str.isalnum() accepts, plus underscore.
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w. ]")
+_REPEATED_SPACES = re.compile(r" {2,}")
+
 
 # -----------------------------
 # Data structures
 # -----------------------------
 
+# One darktable-cli command argument, already encoded for the OS (see _cmd_arg()).
+CmdArg = Union[str, bytes]
+
 @dataclass(frozen=True)
 class ExportResult:
     """
@@ -67,6 +140,24 @@ class ExportResult:
     zip_path: Optional[Path]
 
 
+@dataclass(frozen=True)
+class SequenceExport:
+    """
+    One sequence folder and the output path assigned to each of its DNGs.
+    inputs and outputs line up by position.
+
+    outputs are plain strings: they are only ever handed to the OS and written
+    to the manifest, so there is no point building a Path for every frame.
+    """
+    input_dir: Path
+    inputs: List[Path]
+    outputs: List[str]
+
+
+class ExportError(RuntimeError):
+    """Raised when a sequence fails to export. The message is ready to show to the user."""
+
+
 # -----------------------------
 # Small helpers
 # -----------------------------
@@ -91,6 +182,39 @@ def which_or_die(tool: str) -> str:
     return found
 
 
+def default_jobs() -> int:
+    """
+    Default number of parallel darktable-cli processes.
+
+    Half the CPU count leaves headroom, since each darktable process
+    is itself multi-threaded.
+    """
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def darktable_configdir() -> Path:
+    """
+    The user's darktable config dir, where darktable keeps its settings and style database.
+
+    Resolved the way darktable itself does (GLib's user config dir):
+      - Windows: %LOCALAPPDATA%\\darktable
+      - elsewhere: $XDG_CONFIG_HOME/darktable if set, else ~/.config/darktable (macOS too)
+
+    Each worker gets a private copy so parallel runs do not fight over the database lock.
+    """
+    if os.name == "nt":
+        local_appdata = os.environ.get("LOCALAPPDATA")
+        if local_appdata:
+            return Path(local_appdata) / "darktable"
+        return Path.home() / "AppData" / "Local" / "darktable"
+
+    # The XDG spec says relative values are invalid and must be ignored.
+    xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
+    if xdg_config_home and os.path.isabs(xdg_config_home):
+        return Path(xdg_config_home) / "darktable"
+    return Path.home() / ".config" / "darktable"
+
+
 def is_dangerous_directory(path: Path) -> bool:
     """
     Safety guard to prevent accidental recursion in huge or system directories.
@@ -102,61 +226,96 @@ def is_dangerous_directory(path: Path) -> bool:
 
     This is intentionally conservative.
     """
-    p = path.resolve()
-
-    # Common "do not do this" roots
-    dangerous = {
-        Path("/"),
-        Path("/System"),
-        Path("/Library"),
-        Path("/Applications"),
-        Path("/Users"),
-    }
-    if p in dangerous:
-        return True
-
-    # Avoid running at the home directory root by default.
-    # You can still run on a subfolder inside home, which is the normal use case.
-    try:
-        if p == Path.home().resolve():
-            return True
-    except Exception:
-        # If anything weird happens resolving home, do not block.
-        pass
-
-    return False
+    return os.path.realpath(path) in DANGEROUS_DIRECTORIES
 
 
 # -----------------------------
 # File discovery and grouping
 # -----------------------------
 
-def iter_dngs(root: Path) -> List[Path]:
+def _is_dng_name(name: str) -> bool:
     """
-    Recursively find all DNG files under the given root directory.
+    True if a file name has a DNG extension, in any letter case.
+
+    Equivalent to os.path.splitext(name)[1].lower() in DNG_EXTS, but this runs for
+    every file in the dataset, so the common spellings skip the split and lowercase.
+    The fallback slices the last 4 characters, which covers ".dng".
+
+    Like splitext, a name that is only dots before the extension (".dng") counts as
+    a hidden file with no extension, not as a DNG.
+    """
+    if not (name.endswith(_DNG_SUFFIXES) or name[-4:].lower() in DNG_EXTS):
+        return False
+    return bool(name[:-4].lstrip("."))
+
+
+def _scan_dir(directory: str) -> Tuple[List[str], List[str]]:
+    """
+    List one folder with os.scandir.
 
     Returns:
-      A sorted list of Paths.
+      (sorted DNG file names, subfolder paths)
 
-    Notes:
-      This does a full recursive walk. That is why we use is_dangerous_directory()
-      to avoid accidentally running in giant folders.
+    scandir hands back the file type with each directory entry, so checking
+    is_dir()/is_file() costs no extra stat() call in the common case.
+
+    Symlinked folders are not followed (so a link loop cannot trap the walk),
+    but symlinked DNG files are kept. A folder we are not allowed to list is
+    treated as empty.
     """
-    dngs: List[Path] = []
-    for p in root.rglob("*"):
-        if p.is_file() and p.suffix.lower() in DNG_EXTS:
-            dngs.append(p)
+    names: List[str] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif _is_dng_name(entry.name) and entry.is_file():
+                    names.append(entry.name)
+    except PermissionError:
+        # Unreadable folders are skipped, not fatal. External volumes on macOS
+        # routinely carry .Trashes and .Spotlight-V100 folders we cannot list.
+        return [], []
 
-    # Sorting provides stability:
-    # - makes exports deterministic
-    # - makes output file naming consistent across runs
-    dngs.sort()
-    return dngs
+    names.sort()
+    return names, subdirs
+
+
+def _group(directory: str, names: List[str]) -> Tuple[Path, List[Path]]:
+    """Build a (folder, files) group. Path objects are only created for DNGs we keep."""
+    parent = Path(directory)
+    return parent, [parent / name for name in names]
+
+
+def _scan_groups(subdirs: List[str]) -> List[Tuple[str, List[str]]]:
+    """
+    Return (folder, sorted DNG file names) for every folder in subdirs and below.
 
+    Each scandir call already knows which folder it is listing, so we group while
+    walking instead of collecting a flat list and regrouping it by p.parent later.
+    Folders without DNGs are not sequences and are skipped.
 
-def group_by_parent_dir(dngs: List[Path]) -> List[Tuple[Path, List[Path]]]:
+    The walk goes one tree level at a time and lists all folders of a level
+    concurrently. scandir releases the GIL while it waits on the filesystem, so on
+    network mounts (NFS, SMB, cloud drives), where every listing is a round trip,
+    discovery costs roughly one round trip per level instead of one per folder.
     """
-    Group DNGs by their parent folder.
+    listings: List[Tuple[str, List[str]]] = []
+    level = subdirs
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        while level:
+            next_level: List[str] = []
+            for directory, (names, children) in zip(level, pool.map(_scan_dir, level)):
+                if names:
+                    listings.append((directory, names))
+                next_level += children
+            level = next_level
+    return listings
+
+
+def walk_and_group(root: Path) -> List[Tuple[Path, List[Path]]]:
+    """
+    Recursively find all DNG files under root, grouped by their parent folder.
 
     Why group by parent?
       CinemaDNG sequences are often stored like:
@@ -166,20 +325,33 @@ def group_by_parent_dir(dngs: List[Path]) -> List[Tuple[Path, List[Path]]]:
       Grouping by parent lets us preserve "sequence identity" in output names.
 
     Returns:
-      A list of (parent_directory, files_in_that_directory), sorted by directory path.
-    """
-    groups: dict[Path, List[Path]] = {}
-    for p in dngs:
-        groups.setdefault(p.parent, []).append(p)
+      A list of (parent_directory, files_in_that_directory), sorted by directory path,
+      with the files in each group sorted by name.
 
-    # Sort groups by the directory path string for deterministic ordering.
-    grouped = sorted(groups.items(), key=lambda kv: str(kv[0]))
+    Notes:
+      This does a full recursive walk. That is why we use is_dangerous_directory()
+      to avoid accidentally running in giant folders.
 
-    # Within each group, sort files as well (rglob already sorted, but safe anyway).
-    for parent, files in grouped:
-        files.sort()
+      Fast path: the common case is pointing splatpack straight at one take folder.
+      If root has no subfolders, the single listing of root is the whole answer,
+      and we return it without starting the recursive walk.
+    """
+    root_str = str(root)
+    names, subdirs = _scan_dir(root_str)
+    if not subdirs:
+        return [_group(root_str, names)] if names else []
 
-    return grouped
+    listings = _scan_groups(subdirs)
+    if names:
+        listings.append((root_str, names))
+
+    # Sorting provides stability:
+    # - makes exports deterministic
+    # - makes output file naming consistent across runs
+    # We sort the raw (folder string, names) listings: folder paths are unique, so the
+    # tuples order by folder string alone, and Paths are only built once, afterwards.
+    listings.sort()
+    return [_group(directory, dng_names) for directory, dng_names in listings]
 
 
 # -----------------------------
@@ -196,6 +368,7 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=4096)
 def safe_name(text: str) -> str:
     """
     Convert a string into something safe-ish for filenames.
@@ -204,23 +377,17 @@ def safe_name(text: str) -> str:
     This is used for:
       - job names
       - sequence folder names embedded into export filenames
+
+    Results are cached: the same folder names come up again and again,
+    and the inputs are short strings, so the cache stays small.
     """
     text = (text or "").strip()
     if not text:
         return "dataset"
 
-    out: List[str] = []
-    for ch in text:
-        if ch.isalnum() or ch in ("_", ".", " "):
-            out.append(ch)
-        else:
-            out.append("_")
-
-    # Basic cleanup
-    safe = "".join(out).strip()
-    while "  " in safe:
-        safe = safe.replace("  ", " ")
-    return safe
+    # One regex pass each, both run in C rather than a per-character Python loop.
+    safe = _UNSAFE_NAME_CHARS.sub("_", text).strip()
+    return _REPEATED_SPACES.sub(" ", safe)
 
 
 def default_job_name(dataset_dir: Path) -> str:
@@ -232,25 +399,13 @@ def default_job_name(dataset_dir: Path) -> str:
 # darktable-cli export
 # -----------------------------
 
-def run_darktable_export(
-    darktable_cli: str,
-    input_file: Path,
-    output_file: Path,
-    style: Optional[str],
-    jpg_quality: int,
-    max_long_edge: Optional[int],
-) -> None:
+def export_settings(jpg_quality: int, max_long_edge: Optional[int]) -> dict[str, str]:
     """
-    Export one DNG to one JPG using darktable-cli.
+    darktable config keys for our export settings.
 
-    darktable-cli takes an input file and output file:
-      darktable-cli input.dng output.jpg
-
-    It can also apply:
-      --style "Style Name"
-
-    And it can accept configuration values via:
-      --conf key=value
+    These go into the darktablerc of each worker config dir (see worker_configdirs()),
+    so darktable reads them once at startup instead of us passing --conf key=value
+    on every command line.
 
     About resizing:
       darktable can resize via modules or export settings, but the exact configuration keys
@@ -260,27 +415,345 @@ def run_darktable_export(
       The intent is "max dimension", not "force exact size". Depending on your version,
       you may need to move resizing into the style.
     """
-    cmd = [darktable_cli, str(input_file), str(output_file)]
-
-    if style:
-        cmd += ["--style", style]
-
     # Export settings. Quality key is widely used.
-    conf_items: List[str] = []
-    conf_items.append(f"plugins/imageio/format/jpeg/quality={jpg_quality}")
+    settings = {"plugins/imageio/format/jpeg/quality": str(jpg_quality)}
+
+    # The user's darktablerc may have recursive import switched on. A batch run over a
+    # take folder must only pick up that folder's frames, not those of its subfolders.
+    settings["ui_last/import_recursive"] = "FALSE"
 
     if max_long_edge:
         # Best effort. Some builds ignore these keys or use different ones.
         # If you notice no resizing, the fix is to add a resize module in your style.
-        conf_items.append(f"plugins/imageio/format/jpeg/width={max_long_edge}")
-        conf_items.append(f"plugins/imageio/format/jpeg/height={max_long_edge}")
+        settings["plugins/imageio/format/jpeg/width"] = str(max_long_edge)
+        settings["plugins/imageio/format/jpeg/height"] = str(max_long_edge)
+
+    return settings
+
+
+def darktable_options(style: Optional[str], configdir: Path) -> List[str]:
+    """
+    Build the darktable-cli options that follow the input and output arguments.
 
-    for item in conf_items:
-        cmd += ["--conf", item]
+    darktable-cli can apply:
+      --style "Style Name"
+
+    And everything after --core is passed through to the darktable core, which we use
+    to point darktable at a worker config dir from worker_configdirs().
+    """
+    opts: List[str] = []
+
+    if style:
+        opts += ["--style", style]
+
+    opts += ["--core", "--configdir", str(configdir)]
+    return opts
 
-    # We silence stdout to keep the terminal readable.
-    # If darktable errors, we capture stderr and show it to you.
-    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+async def _read_tail(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """
+    Read stream to EOF, keeping only the last limit bytes.
+
+    Chunks go into a ring buffer (a deque we trim from the front), so memory stays
+    bounded however much the child writes.
+    """
+    chunks: "collections.deque[bytes]" = collections.deque()
+    size = 0
+    while True:
+        chunk = await stream.read(limit)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        while size - len(chunks[0]) >= limit:
+            size -= len(chunks.popleft())
+    return b"".join(chunks)[-limit:]
+
+
+def _cmd_arg(value: str) -> CmdArg:
+    """Encode one command argument the way subprocess would, so it can be reused as is."""
+    return os.fsencode(value) if ENCODE_CMD_ARGS else value
+
+
+async def _run_darktable(cmd: List[CmdArg]) -> None:
+    """
+    Run one darktable-cli command as an asyncio child process.
+
+    We silence stdout to keep the terminal readable.
+    If darktable errors, we raise CalledProcessError with the tail of its stderr,
+    so you can see why.
+
+    The event loop drains the stderr pipes of all running children from one selector,
+    no helper thread per process.
+
+    If the awaiting task is cancelled (another export failed), the child is killed
+    rather than left running in the background.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    try:
+        stderr = await _read_tail(proc.stderr, STDERR_TAIL_BYTES)
+        await proc.wait()
+    except asyncio.CancelledError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+
+
+async def run_darktable_export(
+    darktable_cli: CmdArg,
+    input_file: str,
+    output_file: str,
+    options: List[CmdArg],
+) -> None:
+    """
+    Export one DNG to one JPG using darktable-cli.
+
+    darktable-cli takes an input file and output file:
+      darktable-cli input.dng output.jpg
+
+    darktable_cli and options are prebuilt and pre-encoded by export_all(),
+    only the input and output change from run to run.
+    """
+    cmd = [darktable_cli, _cmd_arg(input_file), _cmd_arg(output_file), *options]
+    await _run_darktable(cmd)
+
+
+async def run_darktable_export_batch(
+    darktable_cli: CmdArg,
+    input_dir: str,
+    output_dir: str,
+    options: List[CmdArg],
+) -> None:
+    """
+    Export every image in one folder with a single darktable-cli run.
+
+    darktable-cli also accepts a folder as input, plus an output pattern:
+      darktable-cli take001/ out/$(FILE_NAME).jpg
+
+    Starting darktable and building the pixelpipe costs over a second per run,
+    so paying it once per sequence instead of once per frame is a big win.
+    Each output is named after its input file, e.g. 000001.dng -> out/000001.jpg.
+    """
+    output_pattern = os.path.join(output_dir, "$(FILE_NAME).jpg")
+    cmd = [darktable_cli, _cmd_arg(input_dir), _cmd_arg(output_pattern), *options]
+    await _run_darktable(cmd)
+
+
+async def _report_batch_progress(staging_dir: str, label: str, total: int) -> None:
+    """
+    Print progress of a running batch export until cancelled.
+
+    darktable prints nothing we could parse per frame, so we count the JPGs it has
+    written to staging_dir so far and print a line every PROGRESS_EVERY frames.
+    """
+    reported = 0
+    while True:
+        await asyncio.sleep(PROGRESS_POLL_SECONDS)
+        count = len(os.listdir(staging_dir))
+        if count // PROGRESS_EVERY > reported // PROGRESS_EVERY:
+            reported = count
+            eprint(f"  {label}: {count}/{total} images...")
+
+
+def batch_safe(seq: SequenceExport) -> bool:
+    """
+    True if a batch run over seq.input_dir yields exactly one <stem>.jpg per DNG.
+
+    A batch run exports whatever darktable imports from the folder, not our DNG list,
+    and names each output after its input file. That only maps back cleanly when:
+      - the DNG stems are unique (000001.dng next to 000001.DNG would both become
+        000001.jpg, and darktable writes the second as 000001_01.jpg)
+      - the folder holds no other files darktable might import (000001.jpg or .tif
+        next to 000001.dng), only DNGs, dotfiles and BATCH_SAFE_EXTS files
+
+    Subfolders are fine: export_settings() turns off recursive import.
+    """
+    stems = {f.stem.casefold() for f in seq.inputs}
+    if len(stems) != len(seq.inputs):
+        return False
+
+    dng_names = {f.name for f in seq.inputs}
+    with os.scandir(seq.input_dir) as it:
+        for entry in it:
+            if entry.name in dng_names or entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                continue
+            if os.path.splitext(entry.name)[1].lower() not in BATCH_SAFE_EXTS:
+                return False
+    return True
+
+
+async def export_sequence(
+    darktable_cli: CmdArg,
+    seq: SequenceExport,
+    staging_dir: str,
+    options: List[CmdArg],
+    done: Set[str],
+) -> None:
+    """
+    Export one sequence folder to its final output names.
+
+    Sequences with several frames go through one batch run into staging_dir,
+    then each JPG is renamed to its <sequence_name>_<index>.jpg output name.
+    A single frame is exported directly, there is nothing to amortize.
+
+    Outputs listed in done (already exported by the run being resumed) are skipped.
+    A partly done sequence is finished frame by frame, because a batch run always
+    exports the whole folder. So is a folder where batch_safe() says the batch
+    outputs could not be mapped back to our DNGs reliably.
+    """
+    todo = [(f, out) for f, out in zip(seq.inputs, seq.outputs) if out not in done]
+    label = seq.input_dir.name
+    if len(todo) == 1 or len(todo) < len(seq.inputs) or not batch_safe(seq):
+        for n, (input_file, output_file) in enumerate(todo, 1):
+            await run_darktable_export(darktable_cli, str(input_file), output_file, options)
+            if n % PROGRESS_EVERY == 0 and n < len(todo):
+                eprint(f"  {label}: {n}/{len(todo)} images...")
+        return
+
+    os.makedirs(staging_dir, exist_ok=True)
+    progress = asyncio.ensure_future(_report_batch_progress(staging_dir, label, len(todo)))
+    try:
+        await run_darktable_export_batch(darktable_cli, str(seq.input_dir), staging_dir, options)
+    finally:
+        progress.cancel()
+
+    for input_file, output_file in todo:
+        try:
+            os.rename(os.path.join(staging_dir, f"{input_file.stem}.jpg"), output_file)
+        except FileNotFoundError as ex:
+            # darktable exited cleanly but an expected JPG is missing.
+            raise ExportError(f"Missing darktable output for: {input_file}\n{ex}") from ex
+
+    # Anything left over is not one of our DNGs (for example a stray JPG in the take folder).
+    shutil.rmtree(staging_dir)
+
+
+async def export_all(
+    darktable_cli: str,
+    sequences: List[SequenceExport],
+    staging_root: Path,
+    style: Optional[str],
+    configdirs: List[Path],
+    manifest: ManifestWriter,
+    done: Set[str],
+) -> None:
+    """
+    Export every sequence, running up to len(configdirs) darktable-cli processes at once.
+    Finished sequences are added to the manifest as soon as they land.
+    Outputs in done are already exported and are skipped.
+
+    Everything runs on one asyncio event loop: it waits on all children and drains
+    their stderr pipes together, and prints progress as each sequence finishes.
+
+    The config dirs double as the concurrency limit. Each export borrows one from
+    a queue for as long as its darktable process runs, so no two running processes
+    ever share a config dir. Only the input and output arguments change between runs,
+    so the darktable-cli path and the options for each config dir are built and
+    encoded once here and reused.
+
+    Raises ExportError on the first failure, after stopping the other exports.
+    """
+    darktable_cli_arg = _cmd_arg(darktable_cli)
+    free_slots: "asyncio.Queue[List[CmdArg]]" = asyncio.Queue()
+    for d in configdirs:
+        free_slots.put_nowait([_cmd_arg(opt) for opt in darktable_options(style, d)])
+
+    staging_root_str = str(staging_root)
+
+    async def export_one(seq_index: int, seq: SequenceExport) -> SequenceExport:
+        options = await free_slots.get()
+        try:
+            await export_sequence(
+                darktable_cli=darktable_cli_arg,
+                seq=seq,
+                # Sequences can share frame names (take001/000001.dng, take002/000001.dng),
+                # so each one gets its own staging folder.
+                staging_dir=os.path.join(staging_root_str, f"{seq_index:06d}"),
+                options=options,
+                done=done,
+            )
+        except subprocess.CalledProcessError as ex:
+            # If darktable fails, print stderr so you can see why.
+            stderr = ex.stderr.decode("utf-8", errors="replace") if ex.stderr else ""
+            raise ExportError(f"darktable-cli failed on: {seq.input_dir}\n{stderr}") from ex
+        except OSError as ex:
+            # For example darktable-cli could not be started, or the staging folder
+            # could not be created or removed. The error names the file involved.
+            raise ExportError(f"Export failed on: {seq.input_dir}\n{ex}") from ex
+        finally:
+            free_slots.put_nowait(options)
+
+        manifest.add(seq.outputs)
+        return seq
+
+    total = sum(len(seq.inputs) for seq in sequences)
+    tasks = [asyncio.ensure_future(export_one(i, seq)) for i, seq in enumerate(sequences)]
+    try:
+        finished = 0
+        for next_done in asyncio.as_completed(tasks):
+            seq = await next_done
+
+            # Lightweight progress indicator
+            finished += len(seq.inputs)
+            eprint(f"Exported {finished}/{total} images ({seq.input_dir.name})")
+    finally:
+        # Only does anything after a failure: stop exports still running or waiting for a slot.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _darktablerc_text(settings: dict[str, str]) -> str:
+    """
+    The user's darktablerc with our export settings applied on top.
+
+    darktablerc is a plain list of key=value lines. We drop the user's lines for the
+    keys we set and append ours, keeping every other preference as it was.
+    """
+    lines: List[str] = []
+    user_rc = darktable_configdir() / DARKTABLE_RC
+    if user_rc.is_file():
+        with open(user_rc, encoding="utf-8", errors="surrogateescape") as fh:
+            lines = [line for line in fh if line.split("=", 1)[0] not in settings]
+
+    lines += [f"{key}={value}\n" for key, value in settings.items()]
+    return "".join(lines)
+
+
+@contextmanager
+def worker_configdirs(jobs: int, settings: dict[str, str]) -> Iterator[List[Path]]:
+    """
+    Provide one temporary darktable config dir per parallel worker.
+
+    Each one is seeded with:
+      - the user's style database, so --style keeps working
+      - the user's preferences with our export settings applied (see export_settings())
+
+    darktable needs one config dir per running process, otherwise it refuses to start
+    because another instance holds the database lock. We use them even for a single
+    job, since that is also how the export settings reach darktable.
+    The temporary dirs are removed when the context exits.
+    """
+    rc_text = _darktablerc_text(settings)
+    style_db = darktable_configdir() / DARKTABLE_STYLE_DB
+
+    with tempfile.TemporaryDirectory(prefix="splatpack_dt_") as tmp:
+        dirs: List[Path] = []
+        for i in range(jobs):
+            d = Path(tmp) / f"worker{i:02d}"
+            ensure_dir(d)
+            if style_db.is_file():
+                shutil.copy2(style_db, d / DARKTABLE_STYLE_DB)
+            (d / DARKTABLE_RC).write_text(rc_text, encoding="utf-8", errors="surrogateescape")
+            dirs.append(d)
+        yield dirs
 
 
 # -----------------------------
@@ -288,29 +761,147 @@ def run_darktable_export(
 # -----------------------------
 
 def write_job_json(job_dir: Path, payload: dict) -> None:
-    """Write job.json metadata file."""
+    """
+    Write job.json metadata file.
+
+    Uses orjson when it is installed, otherwise the standard library json module.
+    orjson rejects strings that are not valid UTF-8 (possible in paths with odd bytes),
+    so those payloads also go through json.
+    """
     p = job_dir / "job.json"
-    p.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if orjson is not None:
+        try:
+            p.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            return
+        except orjson.JSONEncodeError:
+            pass
+
+    with open(p, "w", buffering=WRITE_BUFFER_SIZE, encoding="utf-8") as fh:
+        json.dump(payload, fh, indent=2)
 
 
-def write_manifest(job_dir: Path, image_paths: List[Path]) -> None:
+def _ends_with_newline(path: Path) -> bool:
+    """True if the file at path is empty or its last byte is a newline."""
+    with open(path, "rb") as fh:
+        if fh.seek(0, os.SEEK_END) == 0:
+            return True
+        fh.seek(-1, os.SEEK_END)
+        return fh.read(1) == b"\n"
+
+
+class ManifestWriter:
     """
-    Write a manifest file listing exported images.
+    Write manifest.txt, the list of exported images, while the export runs.
 
     This is helpful for:
     - debugging
     - later automation steps (the PC can read exactly what images exist)
+    - recovering from a failed run: the manifest lists every image that made it
+
+    Each sequence's new outputs are appended as soon as it finishes. The file is opened
+    in append mode, so on --resume the previous run's entries stay put and only outputs
+    that were not already done are added. A failed resumed run never loses the record
+    of what was exported before.
+
+    Sequences finish in any order when exporting in parallel, so appended lines are not
+    in export order. finish() rewrites the complete list in export order once the whole
+    job has succeeded, through a temporary file and os.replace, so there is never a
+    moment without a manifest.
+
+    Lines go through a 1 MiB buffer, flushed after each sequence lands.
     """
-    p = job_dir / "manifest.txt"
-    p.write_text("\n".join(str(x) for x in image_paths) + "\n", encoding="utf-8")
+
+    def __init__(self, job_dir: Path, done: Set[str]) -> None:
+        self._path = job_dir / "manifest.txt"
+        self._done = done
+        self._fh = open(self._path, "a", buffering=WRITE_BUFFER_SIZE, encoding="utf-8")
+        # A run that died mid-write can leave the last line cut short. End it first,
+        # so our first entry does not get glued onto it.
+        if not _ends_with_newline(self._path):
+            self._fh.write("\n")
+
+    def add(self, image_paths: List[str]) -> None:
+        """Record the outputs of one finished sequence."""
+        self._fh.writelines(f"{x}\n" for x in image_paths if x not in self._done)
+        self._fh.flush()
+
+    def finish(self, image_paths: List[str]) -> None:
+        """Replace the manifest with the full list of outputs, in export order."""
+        self.close()
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        with open(tmp_path, "w", buffering=WRITE_BUFFER_SIZE, encoding="utf-8") as fh:
+            fh.writelines(f"{x}\n" for x in image_paths)
+        os.replace(tmp_path, self._path)
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> "ManifestWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def load_exported(job_dir: Path) -> Tuple[Set[str], Set[str]]:
+    """
+    Check what a previous run of job_dir left behind, for --resume.
+
+    Returns:
+      (done, untrusted), both as file names inside images/
+      done: images manifest.txt lists that are still in images/. These are skipped.
+      untrusted: images in images/ that the manifest does not list.
+
+    The manifest is only written after an image is complete, so an untrusted image may
+    be a JPG darktable was halfway through writing when the run died. The caller must
+    remove those before exporting again: darktable does not overwrite an existing file,
+    it would write <name>_01.jpg next to it.
+
+    Manifest lines are full paths, but the previous run may have spelled the job folder
+    differently (an --out through a symlink, or with ".." in it), so only the file names
+    are compared. A line cut short by a crash names no file and simply matches nothing.
+
+    images/ is listed once with scandir rather than checking each frame with a stat().
+    """
+    manifest_path = job_dir / "manifest.txt"
+    images_dir = job_dir / DEFAULT_IMAGES_DIRNAME
+    if not images_dir.is_dir():
+        return set(), set()
+
+    listed: Set[str] = set()
+    if manifest_path.is_file():
+        with open(manifest_path, encoding="utf-8") as fh:
+            listed = {os.path.basename(line.rstrip("\n")) for line in fh}
+
+    with os.scandir(images_dir) as it:
+        on_disk = {entry.name for entry in it}
+
+    return listed & on_disk, on_disk - listed
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file. Runs on zip_job()'s reader threads."""
+    with open(path, "rb") as fh:
+        return fh.read()
 
 
 def zip_job(job_dir: Path, zip_path: Path) -> Path:
     """
     Create a zip archive of job_dir.
 
-    shutil.make_archive wants a base name without suffix.
     We accept a path that may or may not end in .zip and normalize it.
+    Archive paths are relative to job_dir, so the zip contains images/, manifest.txt
+    and job.json at its top level.
+
+    Files are stored without compression. The bundle is almost entirely JPEGs,
+    which are already compressed, so DEFLATE would burn minutes of CPU on a large
+    job for next to no size reduction. Stored is also what transfer tools and
+    unzip handle fastest.
+
+    With compression out of the way, the cost is reading every file, its CRC32 and
+    writing it out. A small thread pool reads up to ZIP_READ_AHEAD files ahead while
+    the main thread checksums and writes the current one, so disk reads overlap with
+    the archive writes instead of alternating with them.
     """
     if zip_path.suffix.lower() != ".zip":
         zip_path = zip_path.with_suffix(".zip")
@@ -318,9 +909,116 @@ def zip_job(job_dir: Path, zip_path: Path) -> Path:
     if zip_path.exists():
         zip_path.unlink()
 
-    base_name = str(zip_path.with_suffix(""))
-    archive = shutil.make_archive(base_name, "zip", root_dir=str(job_dir))
-    return Path(archive)
+    # (full path, archive name, is_dir), in archive order.
+    # Walk in sorted order so the archive layout is deterministic.
+    entries: List[Tuple[str, str, bool]] = []
+    for root, dirs, files in os.walk(job_dir):
+        dirs.sort()
+        if root != str(job_dir):
+            entries.append((root, os.path.relpath(root, job_dir), True))
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            entries.append((full, os.path.relpath(full, job_dir), False))
+
+    with ThreadPoolExecutor(max_workers=ZIP_READERS) as pool, zipfile.ZipFile(
+        zip_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+    ) as zf:
+        pending: "collections.deque[Tuple[str, str, Optional[Future[bytes]]]]" = collections.deque()
+        next_entry = 0
+
+        while next_entry < len(entries) or pending:
+            # Keep the read-ahead window full. Memory use is bounded by the window size.
+            while next_entry < len(entries) and len(pending) < ZIP_READ_AHEAD:
+                full, arcname, is_dir = entries[next_entry]
+                pending.append((full, arcname, None if is_dir else pool.submit(_read_file, full)))
+                next_entry += 1
+
+            full, arcname, read = pending.popleft()
+            if read is None:
+                zf.write(full, arcname)
+                continue
+
+            # from_file keeps the file's timestamp and permissions, like zf.write would.
+            zinfo = zipfile.ZipInfo.from_file(full, arcname)
+            zinfo.compress_type = zipfile.ZIP_STORED
+            zf.writestr(zinfo, read.result())
+
+    return zip_path
+
+
+def _copy_file_data(src, dst, size: int) -> None:
+    """
+    Copy size bytes from the open file src to the open file dst.
+
+    On Linux we use os.sendfile, which copies page cache pages to the output file
+    inside the kernel instead of reading every byte into Python and writing it back.
+    Elsewhere (macOS only supports sendfile to sockets) we fall back to copyfileobj.
+    """
+    if sys.platform.startswith("linux"):
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+            if sent == 0:
+                raise OSError(f"File shrank while archiving: {src.name}")
+            offset += sent
+    else:
+        shutil.copyfileobj(src, dst, WRITE_BUFFER_SIZE)
+
+
+def tar_job(job_dir: Path, tar_path: Path) -> Path:
+    """
+    Create an uncompressed tar archive of job_dir.
+
+    We accept a path that may or may not end in .tar and normalize it.
+    Archive paths are relative to job_dir, the same layout as zip_job().
+
+    tar is the cheapest bundle format: no compression and no CRC per file.
+    We write the archive ourselves (TarInfo builds the headers) so file data can be
+    copied with _copy_file_data() rather than through TarFile's Python-level copy.
+    """
+    if tar_path.suffix.lower() != ".tar":
+        tar_path = tar_path.with_suffix(".tar")
+
+    if tar_path.exists():
+        tar_path.unlink()
+
+    # Unbuffered, so header writes and sendfile() land in order on the same fd.
+    with open(tar_path, "wb", buffering=0) as out:
+        written = 0
+        for root, dirs, files in os.walk(job_dir):
+            # Walk in sorted order so the archive layout is deterministic.
+            dirs.sort()
+            entries = [root] if root != str(job_dir) else []
+            entries += [os.path.join(root, name) for name in sorted(files)]
+
+            for full in entries:
+                st = os.stat(full)
+                info = tarfile.TarInfo(os.path.relpath(full, job_dir))
+                info.mtime = int(st.st_mtime)
+                info.mode = st.st_mode & 0o7777
+                if os.path.isdir(full):
+                    info.type = tarfile.DIRTYPE
+                else:
+                    info.size = st.st_size
+
+                header = info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+                out.write(header)
+                written += len(header)
+
+                if info.size:
+                    with open(full, "rb") as src:
+                        _copy_file_data(src, out, info.size)
+                    # File data is padded to a whole number of blocks.
+                    padding = -info.size % tarfile.BLOCKSIZE
+                    out.write(b"\0" * padding)
+                    written += info.size + padding
+
+        # End of archive: two empty blocks, then pad to a full record like tarfile does.
+        trailer = 2 * tarfile.BLOCKSIZE
+        trailer += -(written + trailer) % tarfile.RECORDSIZE
+        out.write(b"\0" * trailer)
+
+    return tar_path
 
 
 # -----------------------------
@@ -335,9 +1033,9 @@ def main() -> None:
       - validate environment
       - discover inputs
       - create job directory
-      - export with darktable-cli
-      - write manifest and metadata
-      - optionally zip
+      - export with darktable-cli, writing the manifest as we go
+      - write metadata
+      - optionally zip or tar
     """
     parser = argparse.ArgumentParser(
         prog="splatpack",
@@ -377,18 +1075,40 @@ def main() -> None:
         help="Optional max long edge in pixels. Best practice is to bake resize into a darktable style.",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_jobs(),
+        help="Number of sequence folders to export in parallel, one darktable-cli process each. "
+        "The frames of one folder are exported one process at a time. Default: half the CPU count",
+    )
+
     parser.add_argument(
         "--zip",
         action="store_true",
         help="Create a zip of the job folder for transport.",
     )
 
+    parser.add_argument(
+        "--tar",
+        action="store_true",
+        help="Create an uncompressed tar of the job folder for transport. Cheaper to build than a zip.",
+    )
+
     parser.add_argument(
         "--job-name",
         default=None,
         help="Override job name. Default is derived from dataset folder name.",
     )
 
+    parser.add_argument(
+        "--resume",
+        metavar="JOB_DIR",
+        default=None,
+        help="Continue an existing job folder instead of starting a new one. "
+        "Images already listed in its manifest are skipped. Use the same dataset and options.",
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -397,6 +1117,9 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        raise SystemExit("--jobs must be at least 1")
+
     # Resolve dataset directory
     dataset_dir = Path(args.path).expanduser().resolve()
     if not dataset_dir.exists() or not dataset_dir.is_dir():
@@ -413,34 +1136,54 @@ def main() -> None:
     darktable_cli = which_or_die("darktable-cli")
 
     # Find inputs
-    dngs = iter_dngs(dataset_dir)
-    if not dngs:
+    groups = walk_and_group(dataset_dir)
+    dng_count = sum(len(files) for _, files in groups)
+    if not dng_count:
         raise SystemExit(f"No DNG files found under: {dataset_dir}")
 
-    groups = group_by_parent_dir(dngs)
-
     # Create a unique job folder name using a timestamp.
     # This avoids collisions and makes it easy to keep multiple runs.
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     job_name = args.job_name or default_job_name(dataset_dir)
 
+    # Work is scheduled one sequence folder at a time, so more workers than
+    # folders would only sit idle (each with its own copy of the style database).
+    workers = min(args.jobs, len(groups))
+
     # Example output:
     #   dataset/_splatpack/myjob_20260113_165501/images/...
-    job_dir = dataset_dir / args.out / f"{job_name}_{timestamp}"
+    if args.resume:
+        job_dir = Path(args.resume).expanduser().resolve()
+        if not job_dir.is_dir():
+            raise SystemExit(f"Not a job directory: {job_dir}")
+    else:
+        job_dir = dataset_dir / args.out / f"{job_name}_{timestamp}"
     images_dir = job_dir / DEFAULT_IMAGES_DIRNAME
 
+    # Output names are deterministic, so a resumed run maps each DNG to the same JPG.
+    done_names, untrusted_names = load_exported(job_dir) if args.resume else (set(), set())
+
     eprint(f"Dataset: {dataset_dir}")
-    eprint(f"DNG files found: {len(dngs)}")
+    eprint(f"DNG files found: {dng_count}")
     eprint(f"Sequence folders found: {len(groups)}")
     eprint(f"Job dir: {job_dir}")
     eprint(f"Images dir: {images_dir}")
+    if args.resume:
+        eprint(f"Resuming: {len(done_names)} images already exported")
     eprint(f"JPEG quality: {args.quality}")
+    eprint(f"Parallel jobs: {workers}")
     if args.style:
         eprint(f"Darktable style: {args.style}")
+        # Styles live in data.db, which each worker copies from the user's config dir.
+        style_db = darktable_configdir() / DARKTABLE_STYLE_DB
+        if not style_db.is_file():
+            eprint(f"Warning: no darktable style database at {style_db}, --style will likely be ignored.")
     if args.max_long_edge:
         eprint(f"Max long edge: {args.max_long_edge}px (best effort)")
     if args.zip:
         eprint("ZIP output: enabled")
+    if args.tar:
+        eprint("TAR output: enabled")
 
     if args.dry_run:
         eprint("Dry run only, no files will be written.")
@@ -449,10 +1192,9 @@ def main() -> None:
     # Create output folders
     ensure_dir(images_dir)
 
-    # Export loop
-    exported: List[Path] = []
-    export_index = 0
-
+    # Build the full list of exports first, so output indices are deterministic
+    # no matter in which order the parallel workers finish.
+    #
     # We include the source sequence folder name in the output filename,
     # so multiple sequences can coexist in one job.
     #
@@ -462,33 +1204,62 @@ def main() -> None:
     #   take001_000001.jpg
     #   take001_000002.jpg
     #   take002_000003.jpg
+    #
+    # The total is known up front, so the output list is allocated once and filled by index.
+    sequences: List[SequenceExport] = []
+    exported: List[str] = [""] * dng_count
+    images_dir_str = str(images_dir)
+    export_index = 0
     for parent_dir, files in groups:
         seq_name = safe_name(parent_dir.name)
 
-        for f in files:
+        start = export_index
+        for _ in files:
+            out_name = f"{seq_name}_{export_index + 1:06d}.jpg"
+            exported[export_index] = os.path.join(images_dir_str, out_name)
             export_index += 1
-            out_name = f"{seq_name}_{export_index:06d}.jpg"
-            out_path = images_dir / out_name
 
-            try:
-                run_darktable_export(
+        sequences.append(SequenceExport(parent_dir, files, exported[start:export_index]))
+
+    # Images of the resumed job that the old manifest does not vouch for may be partial
+    # writes. Remove them, so darktable writes a fresh file under the planned name.
+    done: Set[str] = set()
+    for out in exported:
+        out_name = os.path.basename(out)
+        if out_name in done_names:
+            done.add(out)
+        elif out_name in untrusted_names:
+            os.remove(out)
+
+    # Batch exports land in a per-sequence staging folder before being renamed.
+    # Clear out leftovers from an interrupted run, darktable would not overwrite them.
+    staging_root = job_dir / ".staging"
+    if staging_root.exists():
+        shutil.rmtree(staging_root)
+
+    # Export loop, one darktable-cli run per sequence.
+    # manifest.txt is written as we go, so a failed run still records what was exported.
+    settings = export_settings(args.quality, args.max_long_edge)
+    with worker_configdirs(workers, settings) as configdirs, ManifestWriter(job_dir, done) as manifest:
+        try:
+            asyncio.run(
+                export_all(
                     darktable_cli=darktable_cli,
-                    input_file=f,
-                    output_file=out_path,
+                    sequences=sequences,
+                    staging_root=staging_root,
                     style=args.style,
-                    jpg_quality=args.quality,
-                    max_long_edge=args.max_long_edge,
+                    configdirs=configdirs,
+                    manifest=manifest,
+                    done=done,
                 )
-            except subprocess.CalledProcessError as ex:
-                # If darktable fails, print stderr so you can see why.
-                stderr = ex.stderr.decode("utf-8", errors="replace") if ex.stderr else ""
-                raise SystemExit(f"darktable-cli failed on: {f}\n{stderr}")
+            )
+        except ExportError as ex:
+            raise SystemExit(str(ex))
 
-            exported.append(out_path)
+        manifest.finish(exported)
 
-            # Lightweight progress indicator
-            if export_index % 50 == 0:
-                eprint(f"Exported {export_index} images...")
+    if staging_root.exists():
+        shutil.rmtree(staging_root)
 
     # Write metadata files
     payload = {
@@ -497,31 +1268,40 @@ def main() -> None:
         "dataset_dir": str(dataset_dir),
         "job_dir": str(job_dir),
         "images_dir": str(images_dir),
-        "inputs_found": len(dngs),
+        "inputs_found": dng_count,
         "outputs_written": len(exported),
         "darktable_style": args.style,
         "jpg_quality": args.quality,
         "max_long_edge": args.max_long_edge,
+        "jobs": args.jobs,
         "created_at": timestamp,
         "notes": "If you need reliable resizing, add it to your darktable style.",
     }
     write_job_json(job_dir, payload)
-    write_manifest(job_dir, exported)
 
     # Optional zip bundle
     zip_path: Optional[Path] = None
     if args.zip:
         # Put zip next to job folder inside the out directory
-        zip_path = dataset_dir / args.out / f"{job_name}_{timestamp}.zip"
+        zip_path = job_dir.parent / f"{job_dir.name}.zip"
         zip_path = zip_job(job_dir, zip_path)
         eprint(f"Zipped: {zip_path}")
 
+    # Optional tar bundle
+    tar_path: Optional[Path] = None
+    if args.tar:
+        tar_path = job_dir.parent / f"{job_dir.name}.tar"
+        tar_path = tar_job(job_dir, tar_path)
+        eprint(f"Tarred: {tar_path}")
+
     eprint("")
     eprint("Done.")
     eprint(f"Exported JPGs: {len(exported)}")
     eprint(f"Job folder: {job_dir}")
     if zip_path:
         eprint(f"Job zip: {zip_path}")
+    if tar_path:
+        eprint(f"Job tar: {tar_path}")
 
 
 if __name__ == "__main__":
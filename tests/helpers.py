@@ -0,0 +1,115 @@
+"""
+Shared harness for the end to end tests: a stand-in darktable-cli and a runner.
+
+The fake darktable-cli writes the input path into each output JPG, so the tests can
+tell which DNG produced an image. Like the real one:
+  - it never overwrites an existing file and writes <name>_01.jpg next to it instead
+  - given a folder, it exports every image file in it (not only DNGs), not recursively,
+    each named after its input file
+
+It fails on inputs containing $FAKE_DARKTABLE_FAIL, and appends every input it was
+given to $FAKE_DARKTABLE_LOG.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from typing import List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+FAKE_DARKTABLE_CLI = textwrap.dedent(
+    """\
+    import os
+    import sys
+
+    IMAGE_EXTS = {".dng", ".jpg", ".jpeg", ".tif", ".tiff", ".png", ".exr"}
+
+    def write(src, dst):
+        base, ext = os.path.splitext(dst)
+        n = 0
+        while os.path.exists(dst):
+            n += 1
+            dst = f"{base}_{n:02d}{ext}"
+        with open(dst, "w") as fh:
+            fh.write(src)
+
+    src, dst = sys.argv[1], sys.argv[2]
+    with open(os.environ["FAKE_DARKTABLE_LOG"], "a") as log:
+        log.write(src + "\\n")
+    fail = os.environ.get("FAKE_DARKTABLE_FAIL")
+    if fail and fail in src:
+        sys.exit("fake darktable failure")
+
+    if os.path.isdir(src):
+        out_dir = os.path.dirname(dst)
+        for name in sorted(os.listdir(src)):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() in IMAGE_EXTS and os.path.isfile(os.path.join(src, name)):
+                write(os.path.join(src, name), os.path.join(out_dir, stem + ".jpg"))
+    else:
+        write(src, dst)
+    """
+)
+
+
+@unittest.skipIf(os.name == "nt", "the fake darktable-cli is a POSIX script")
+class SplatpackTestCase(unittest.TestCase):
+    """Runs splatpack on self.dataset, with the fake darktable-cli on PATH."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+        bin_dir = self.root / "bin"
+        bin_dir.mkdir()
+        fake = bin_dir / "darktable-cli"
+        fake.write_text(f"#!{sys.executable}\n{FAKE_DARKTABLE_CLI}")
+        fake.chmod(0o755)
+
+        self.dataset = self.root / "dataset"
+        self.dataset.mkdir()
+        self.darktable_log = self.root / "darktable.log"
+
+        self.env = dict(os.environ)
+        self.env["PATH"] = f"{bin_dir}{os.pathsep}{self.env.get('PATH', '')}"
+        self.env["PYTHONPATH"] = str(REPO_ROOT)
+        self.env["HOME"] = str(self.root / "home")
+        self.env["FAKE_DARKTABLE_LOG"] = str(self.darktable_log)
+        self.env.pop("XDG_CONFIG_HOME", None)
+
+    def make_take(self, name: str, *files: str) -> Path:
+        """Create a take folder in the dataset holding empty files with the given names."""
+        take = self.dataset / name
+        take.mkdir(parents=True)
+        for file_name in files:
+            (take / file_name).write_bytes(b"")
+        return take
+
+    def splatpack(self, *args: str, fail: str = "") -> subprocess.CompletedProcess:
+        env = dict(self.env, FAKE_DARKTABLE_FAIL=fail)
+        return subprocess.run(
+            [sys.executable, "-m", "splatpack.cli", str(self.dataset), "--jobs", "1", *args],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+    def darktable_inputs(self) -> List[str]:
+        """Every input darktable-cli was run on so far, in order."""
+        if not self.darktable_log.is_file():
+            return []
+        return self.darktable_log.read_text().splitlines()
+
+    def job_dir(self, out: Path = None) -> Path:
+        out = out or self.dataset / "_splatpack"
+        (job,) = [p for p in out.iterdir() if p.is_dir()]
+        return job
+
+    def manifest(self, job: Path) -> list:
+        return (job / "manifest.txt").read_text(encoding="utf-8").splitlines()
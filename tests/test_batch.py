@@ -0,0 +1,105 @@
+"""
+End to end tests for batch exports, with the stand-in darktable-cli from helpers.py.
+
+Each test checks which folders darktable-cli was run on as a whole and which fell
+back to one run per frame, and which DNG ended up under which output name.
+"""
+
+import unittest
+from typing import Dict
+
+from helpers import SplatpackTestCase
+
+
+class BatchExportTest(SplatpackTestCase):
+    def exported(self) -> Dict[str, str]:
+        """Output name -> the input darktable exported it from."""
+        images = self.job_dir() / "images"
+        return {p.name: p.read_text() for p in images.iterdir()}
+
+    def test_clean_folders_export_as_one_batch_each(self) -> None:
+        # Both takes use the same frame names, so their staging folders must not mix.
+        take1 = self.make_take("take001", "000001.dng", "000002.dng", "000003.dng")
+        take2 = self.make_take("take002", "000001.dng", "000002.dng")
+
+        result = self.splatpack()
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertEqual(self.darktable_inputs(), [str(take1), str(take2)])
+        self.assertEqual(
+            self.exported(),
+            {
+                "take001_000001.jpg": str(take1 / "000001.dng"),
+                "take001_000002.jpg": str(take1 / "000002.dng"),
+                "take001_000003.jpg": str(take1 / "000003.dng"),
+                "take002_000004.jpg": str(take2 / "000001.dng"),
+                "take002_000005.jpg": str(take2 / "000002.dng"),
+            },
+        )
+        self.assertFalse((self.job_dir() / ".staging").exists())
+
+    def test_sidecars_and_subfolders_keep_the_batch(self) -> None:
+        take = self.make_take("take", "000001.dng", "000002.dng", "000001.xmp", "audio.wav", "notes.txt", ".DS_Store")
+        (take / "proxies").mkdir()
+
+        result = self.splatpack()
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertEqual(self.darktable_inputs(), [str(take)])
+        self.assertEqual(
+            self.exported(),
+            {
+                "take_000001.jpg": str(take / "000001.dng"),
+                "take_000002.jpg": str(take / "000002.dng"),
+            },
+        )
+
+    def test_names_differing_only_in_case_export_frame_by_frame(self) -> None:
+        take = self.make_take("take", "000001.DNG", "000001.dng", "000002.dng")
+        if len(list(take.iterdir())) < 3:
+            self.skipTest("case insensitive filesystem")
+
+        result = self.splatpack()
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        inputs = [str(take / name) for name in ("000001.DNG", "000001.dng", "000002.dng")]
+        self.assertEqual(self.darktable_inputs(), inputs)
+        self.assertEqual(
+            self.exported(),
+            {f"take_{i:06d}.jpg": path for i, path in enumerate(inputs, 1)},
+        )
+
+    def test_stray_image_exports_frame_by_frame(self) -> None:
+        # darktable would import 000001.jpg too, and name its output 000001.jpg as well.
+        stray = self.make_take("stray", "000001.dng", "000002.dng", "000001.jpg")
+        clean = self.make_take("clean", "000001.dng", "000002.dng")
+
+        result = self.splatpack()
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertEqual(
+            self.darktable_inputs(),
+            [str(clean), str(stray / "000001.dng"), str(stray / "000002.dng")],
+        )
+        self.assertEqual(
+            self.exported(),
+            {
+                "clean_000001.jpg": str(clean / "000001.dng"),
+                "clean_000002.jpg": str(clean / "000002.dng"),
+                "stray_000003.jpg": str(stray / "000001.dng"),
+                "stray_000004.jpg": str(stray / "000002.dng"),
+            },
+        )
+
+    def test_single_frame_exports_directly(self) -> None:
+        take = self.make_take("take", "000001.dng")
+
+        result = self.splatpack()
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertEqual(self.darktable_inputs(), [str(take / "000001.dng")])
+        self.assertEqual(self.exported(), {"take_000001.jpg": str(take / "000001.dng")})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Round trip tests for the job bundles: archives are read back with the standard library.
+"""
+
+import os
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from splatpack import cli
+
+
+class TarJobTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+        # Sizes around the block and record boundaries, where padding goes wrong.
+        self.files = {
+            "job.json": b"{}\n",
+            "manifest.txt": b"",
+            "images/empty.jpg": b"",
+            "images/one_block.jpg": b"a" * tarfile.BLOCKSIZE,
+            "images/one_block_and_a_byte.jpg": b"b" * (tarfile.BLOCKSIZE + 1),
+            "images/one_record.jpg": b"c" * tarfile.RECORDSIZE,
+            "images/façade_été_東京.jpg": b"non-ascii",
+        }
+        self.job_dir = self.root / "job"
+        for name, data in self.files.items():
+            path = self.job_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        (self.job_dir / "logs").mkdir()
+
+    def check_round_trip(self) -> None:
+        tar_path = cli.tar_job(self.job_dir, self.root / "job")
+        self.assertEqual(tar_path, self.root / "job.tar")
+        self.assertEqual(tar_path.stat().st_size % tarfile.RECORDSIZE, 0)
+
+        with tarfile.open(tar_path) as tf:
+            members = tf.getmembers()
+            self.assertEqual(
+                [m.name for m in members],
+                [
+                    "job.json",
+                    "manifest.txt",
+                    "images",
+                    "images/empty.jpg",
+                    "images/façade_été_東京.jpg",
+                    "images/one_block.jpg",
+                    "images/one_block_and_a_byte.jpg",
+                    "images/one_record.jpg",
+                    "logs",
+                ],
+            )
+            for member in members:
+                path = self.job_dir / member.name
+                st = path.stat()
+                self.assertEqual(member.mode, st.st_mode & 0o7777, member.name)
+                self.assertEqual(member.mtime, int(st.st_mtime), member.name)
+                if path.is_dir():
+                    self.assertTrue(member.isdir(), member.name)
+                else:
+                    self.assertTrue(member.isfile(), member.name)
+                    self.assertEqual(tf.extractfile(member).read(), self.files[member.name])
+
+    def test_round_trip(self) -> None:
+        self.check_round_trip()
+
+    def test_round_trip_without_sendfile(self) -> None:
+        with mock.patch.object(cli.sys, "platform", "darwin"):
+            self.check_round_trip()
+
+    def test_replaces_existing_archive(self) -> None:
+        (self.root / "job.tar").write_bytes(b"stale" * 5000)
+        self.check_round_trip()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+End to end tests for --resume, with the stand-in darktable-cli from helpers.py.
+"""
+
+import unittest
+
+from helpers import SplatpackTestCase
+
+
+class ResumeTest(SplatpackTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.make_take("takeA", *(f"{i:06d}.dng" for i in range(1, 4)))
+        self.make_take("takeB", *(f"{i:06d}.dng" for i in range(1, 5)))
+
+    def test_resume_replaces_untrusted_image(self) -> None:
+        self.assertEqual(self.splatpack().returncode, 0)
+        job = self.job_dir()
+        images = job / "images"
+
+        # Simulate a run that died while darktable was writing takeB_000006.jpg.
+        partial = images / "takeB_000006.jpg"
+        partial.write_text("partial")
+        (job / "manifest.txt").write_text(
+            "".join(line + "\n" for line in self.manifest(job) if not line.endswith("000006.jpg"))
+        )
+
+        result = self.splatpack("--resume", str(job))
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        self.assertEqual(len(list(images.iterdir())), 7)
+        self.assertEqual(partial.read_text(), str(self.dataset / "takeB" / "000003.dng"))
+        self.assertEqual(self.manifest(job), sorted(str(p) for p in images.iterdir()))
+
+    def test_failed_resume_keeps_manifest(self) -> None:
+        self.assertEqual(self.splatpack().returncode, 0)
+        job = self.job_dir()
+        (job / "images" / "takeB_000006.jpg").unlink()
+        before = self.manifest(job)
+
+        result = self.splatpack("--resume", str(job), fail="takeB")
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("darktable-cli failed on", result.stderr)
+
+        # Everything recorded before is still recorded.
+        self.assertTrue(set(before) <= set(self.manifest(job)))
+
+        result = self.splatpack("--resume", str(job))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Resuming: 6 images already exported", result.stderr)
+        self.assertEqual(len(self.manifest(job)), 7)
+
+    def test_resume_through_symlinked_out_dir(self) -> None:
+        real_out = self.root / "real_out"
+        real_out.mkdir()
+        linked_out = self.root / "linked_out"
+        linked_out.symlink_to(real_out)
+
+        self.assertEqual(self.splatpack("--out", str(linked_out)).returncode, 0)
+        job = self.job_dir(linked_out)
+        images = job / "images"
+        before = {p.name: p.stat().st_mtime_ns for p in images.iterdir()}
+        (images / "takeB_000006.jpg").unlink()
+
+        # The manifest spells the job folder through the symlink, --resume resolves it.
+        result = self.splatpack("--out", str(linked_out), "--resume", str(job))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Resuming: 6 images already exported", result.stderr)
+
+        after = {p.name: p.stat().st_mtime_ns for p in images.iterdir()}
+        self.assertEqual(sorted(after), sorted(before))
+        del before["takeB_000006.jpg"]
+        self.assertEqual({name: after[name] for name in before}, before)
+
+    def test_resume_after_truncated_manifest_line(self) -> None:
+        self.assertEqual(self.splatpack().returncode, 0)
+        job = self.job_dir()
+        images = job / "images"
+        (images / "takeA_000001.jpg").unlink()
+        (images / "takeB_000006.jpg").unlink()
+
+        # The last line was cut short by a crash, with no newline after it.
+        lines = [line for line in self.manifest(job) if not line.endswith(("000001.jpg", "000006.jpg"))]
+        (job / "manifest.txt").write_text("\n".join(lines)[:-6])
+
+        result = self.splatpack("--resume", str(job), fail="takeB")
+        self.assertNotEqual(result.returncode, 0)
+
+        # takeA was exported again and its line landed on a line of its own.
+        self.assertIn(str(images / "takeA_000001.jpg"), self.manifest(job))
+        self.assertIn(lines[-2], self.manifest(job))
+
+        result = self.splatpack("--resume", str(job))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(self.manifest(job), sorted(str(p) for p in images.iterdir()))
+
+
+if __name__ == "__main__":
+    unittest.main()